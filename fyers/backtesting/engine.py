@@ -1,7 +1,13 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
-import psycopg2
+from typing import Callable, Optional
+import io
+import multiprocessing
+import sys
+import threading
+import numpy as np
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
 from .strategies import Strategy, Candle, Signal
 
@@ -11,13 +17,33 @@ class BacktestResult:
     strategy_config: dict
     metrics: dict
     trades: list
-    equity_curve: list
-    drawdowns: list
-    candles: list
-    signals: list
+    equity_curve: np.ndarray  # equity per candle, aligned with the candle columns
+    drawdowns: np.ndarray  # drawdown percent per candle
+    candles: dict
+    signals: list  # signal name per candle, aligned with the candle columns
 
 
-class BacktestEngine:
+CANDLE_COLUMNS = ("timestamp", "datetime", "open", "high", "low", "close", "volume")
+
+# Numeric columns returned by load_candles, in COPY output order
+ARRAY_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# Enum.name is a descriptor call; a dict lookup hands back the same interned strings
+SIGNAL_NAMES = {signal: sys.intern(signal.name) for signal in Signal}
+
+# Rows per round trip when streaming candles from the server-side cursor
+CANDLE_FETCH_SIZE = 50000
+
+# Connections kept per engine/simulator; API handlers run on a thread pool
+DB_POOL_MIN = 1
+DB_POOL_MAX = 8
+
+_worker_engine = None
+
+
+class DatabaseClient:
+    """Holds the Postgres settings and a lazily opened connection pool."""
+
     def __init__(
         self,
         db_host: str = "localhost",
@@ -33,6 +59,25 @@ class BacktestEngine:
             "password": db_password,
             "dbname": db_name
         }
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+
+    def _getconn(self):
+        # The pool is opened on first use so constructing a client never touches the DB
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(DB_POOL_MIN, DB_POOL_MAX, **self.db_config)
+        return self._pool.getconn()
+
+    def _putconn(self, conn):
+        # The pool rolls back whatever read transaction the connection still has open
+        self._pool.putconn(conn)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
 
     def get_candles(
         self,
@@ -40,12 +85,25 @@ class BacktestEngine:
         timeframe: str,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None
-    ) -> list[dict]:
-        conn = psycopg2.connect(**self.db_config)
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+    ) -> dict[str, list]:
+        """Return the candles column-wise, one list per name in CANDLE_COLUMNS.
+
+        datetime is formatted by Postgres, so it arrives as a string.
+        """
+        conn = self._getconn()
+        try:
+            return self._fetch_candles(conn, symbol, timeframe, start_timestamp, end_timestamp)
+        finally:
+            self._putconn(conn)
+
+    def _fetch_candles(self, conn, symbol, timeframe, start_timestamp, end_timestamp) -> dict[str, list]:
+        # Server-side cursor: rows arrive in CANDLE_FETCH_SIZE batches instead of one
+        # fetchall of the whole range
+        cur = conn.cursor(name="candles_stream")
+        cur.itersize = CANDLE_FETCH_SIZE
 
         query = """
-            SELECT timestamp, datetime, open, high, low, close, volume
+            SELECT timestamp, to_char(datetime, 'YYYY-MM-DD HH24:MI:SS'), open, high, low, close, volume
             FROM candles
             WHERE symbol = %s AND timeframe = %s
         """
@@ -62,13 +120,76 @@ class BacktestEngine:
         query += " ORDER BY timestamp ASC"
 
         cur.execute(query, params)
-        rows = cur.fetchall()
+
+        columns = {name: [] for name in CANDLE_COLUMNS}
+        add_ts, add_dt, add_open, add_high, add_low, add_close, add_volume = (
+            values.append for values in columns.values()
+        )
+        for ts, dt, o, h, l, c, v in cur:
+            add_ts(ts)
+            add_dt(dt)
+            add_open(o)
+            add_high(h)
+            add_low(l)
+            add_close(c)
+            add_volume(v)
 
         cur.close()
-        conn.close()
 
-        return [dict(row) for row in rows]
+        return columns
+
+    def load_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None
+    ) -> dict[str, np.ndarray]:
+        """Return the numeric candle columns as contiguous arrays, keyed by ARRAY_COLUMNS.
+
+        For vectorized consumers such as the sweeps, which need no datetime
+        strings and no per-row Python objects.
+        """
+        conn = self._getconn()
+        try:
+            return self._copy_candles(conn, symbol, timeframe, start_timestamp, end_timestamp)
+        finally:
+            self._putconn(conn)
+
+    def _copy_candles(self, conn, symbol, timeframe, start_timestamp, end_timestamp) -> dict[str, np.ndarray]:
+        # COPY streams the whole range as one tab-separated text block, which numpy
+        # parses in C; no row tuples are built on the Python side
+        cur = conn.cursor()
 
+        query = """
+            SELECT timestamp, open, high, low, close, volume
+            FROM candles
+            WHERE symbol = %s AND timeframe = %s
+        """
+        params = [symbol, timeframe]
+
+        if start_timestamp:
+            query += " AND timestamp >= %s"
+            params.append(start_timestamp)
+
+        if end_timestamp:
+            query += " AND timestamp <= %s"
+            params.append(end_timestamp)
+
+        query += " ORDER BY timestamp ASC"
+
+        buf = io.StringIO()
+        cur.copy_expert(f"COPY ({cur.mogrify(query, params).decode()}) TO STDOUT", buf)
+        cur.close()
+
+        rows = np.fromstring(buf.getvalue(), dtype=np.float64, sep=" ").reshape(-1, len(ARRAY_COLUMNS))
+        columns = {name: np.ascontiguousarray(rows[:, i]) for i, name in enumerate(ARRAY_COLUMNS)}
+        columns["timestamp"] = columns["timestamp"].astype(np.int64)
+        columns["volume"] = columns["volume"].astype(np.int64)
+        return columns
+
+
+class BacktestEngine(DatabaseClient):
     def run(
         self,
         strategy: Strategy,
@@ -80,41 +201,30 @@ class BacktestEngine:
     ) -> BacktestResult:
         strategy.reset()
 
-        candle_data = self.get_candles(symbol, timeframe, start_timestamp, end_timestamp)
+        candles_out = self.get_candles(symbol, timeframe, start_timestamp, end_timestamp)
+        n_candles = len(candles_out["timestamp"])
+        strategy.prepare(n_candles)
 
-        candles_out = []
+        # The datetime and price of each signal are the candle's own, so only the
+        # name is recorded per candle
         signals_out = []
+        add_signal = signals_out.append
+        signal_names = SIGNAL_NAMES
 
-        for row in candle_data:
-            candle = Candle(
-                timestamp=row["timestamp"],
-                datetime=str(row["datetime"]),
-                open=row["open"],
-                high=row["high"],
-                low=row["low"],
-                close=row["close"],
-                volume=row["volume"]
-            )
+        for ts, dt, o, h, l, c, v in zip(*(candles_out[name] for name in CANDLE_COLUMNS)):
+            candle = Candle(ts, dt, o, h, l, c, v)
 
             signal = strategy.on_candle(candle)
             strategy.process_signal(signal, candle, quantity)
 
-            candles_out.append({
-                "timestamp": candle.timestamp,
-                "datetime": candle.datetime,
-                "open": candle.open,
-                "high": candle.high,
-                "low": candle.low,
-                "close": candle.close,
-                "volume": candle.volume
-            })
-
-            signals_out.append({
-                "datetime": candle.datetime,
-                "signal": signal.name,
-                "price": candle.close
-            })
+            add_signal(signal_names[signal])
 
+        # Round P&L for all trades in one vectorized call each instead of per trade
+        trades = strategy.state.trades
+        pnls = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+        pnl_percents = np.fromiter((t.pnl_percent for t in trades), dtype=np.float64, count=len(trades))
+        pnls = np.round(pnls, 2).tolist()
+        pnl_percents = np.round(pnl_percents, 2).tolist()
         trades_out = [
             {
                 "entry_time": t.entry_time,
@@ -122,36 +232,76 @@ class BacktestEngine:
                 "exit_time": t.exit_time,
                 "exit_price": t.exit_price,
                 "quantity": t.quantity,
-                "pnl": round(t.pnl, 2),
-                "pnl_percent": round(t.pnl_percent, 2)
+                "pnl": pnl,
+                "pnl_percent": pnl_percent
             }
-            for t in strategy.state.trades
+            for t, pnl, pnl_percent in zip(trades, pnls, pnl_percents)
         ]
 
         return BacktestResult(
             strategy_config=strategy.get_config(),
             metrics=strategy.get_metrics(),
             trades=trades_out,
-            equity_curve=strategy.state.equity_curve,
-            drawdowns=strategy.state.drawdowns,
+            equity_curve=strategy.state.equity_curve[:n_candles],
+            drawdowns=strategy.state.drawdowns[:n_candles],
             candles=candles_out,
             signals=signals_out
         )
 
+    def run_batch(
+        self,
+        strategy_factory: Callable[[], Strategy],
+        specs: list[tuple],
+        max_workers: Optional[int] = None
+    ) -> list[BacktestResult]:
+        """Run one backtest per spec across worker processes, in spec order.
+
+        Each spec is the positional arguments of `run` after the strategy:
+        (symbol, timeframe[, start_timestamp, end_timestamp, quantity]).
+        `strategy_factory` builds a fresh strategy per run and must be picklable,
+        e.g. functools.partial(MACDStrategy, config=...).
+        """
+        if max_workers == 1 or len(specs) <= 1:
+            return [self.run(strategy_factory(), *spec) for spec in specs]
+
+        # Spawned rather than forked workers: the parent may already hold pooled
+        # connections and numba's thread pool, neither of which survives a fork.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(self.db_config,)
+        ) as ex:
+            return list(ex.map(_run_batch_spec, [(strategy_factory, spec) for spec in specs]))
+
     def get_available_data(self) -> list[dict]:
-        conn = psycopg2.connect(**self.db_config)
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        conn = self._getconn()
+        try:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
 
-        cur.execute("""
-            SELECT symbol, timeframe, COUNT(*) as candle_count,
-                   MIN(datetime) as start_date, MAX(datetime) as end_date
-            FROM candles
-            GROUP BY symbol, timeframe
-            ORDER BY symbol, timeframe
-        """)
+            cur.execute("""
+                SELECT symbol, timeframe, COUNT(*) as candle_count,
+                       MIN(datetime) as start_date, MAX(datetime) as end_date
+                FROM candles
+                GROUP BY symbol, timeframe
+                ORDER BY symbol, timeframe
+            """)
 
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+            rows = cur.fetchall()
+            cur.close()
+        finally:
+            self._putconn(conn)
 
         return [dict(row) for row in rows]
+
+
+def _init_batch_worker(db_config: dict):
+    # One engine (and so one connection pool) per worker process, reused across specs
+    global _worker_engine
+    _worker_engine = BacktestEngine()
+    _worker_engine.db_config = db_config
+
+
+def _run_batch_spec(job) -> BacktestResult:
+    strategy_factory, spec = job
+    return _worker_engine.run(strategy_factory(), *spec)
@@ -1,8 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Optional
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import Callable, Optional
 
+from .engine import SIGNAL_NAMES, DatabaseClient
 from .strategies import Strategy, Candle, Signal, RSIStrategy, MACDStrategy, RSIMACDStrategy
 from .strategies.rsi import RSIConfig
 from .strategies.macd import MACDConfig
@@ -10,30 +9,54 @@ from .strategies.macd import MACDConfig
 
 @dataclass
 class SimulatorState:
-    candles: list = field(default_factory=list)
+    candles: dict = field(default_factory=dict)
     current_index: int = 0
     strategy: Optional[Strategy] = None
     symbol: str = ""
     timeframe: str = ""
     history: list = field(default_factory=list)
-
-
-class LiveSimulator:
-    def __init__(
-        self,
-        db_host: str = "localhost",
-        db_port: int = 5432,
-        db_user: str = "trader",
-        db_password: str = "trader123",
-        db_name: str = "fyers"
-    ):
-        self.db_config = {
-            "host": db_host,
-            "port": db_port,
-            "user": db_user,
-            "password": db_password,
-            "dbname": db_name
-        }
+    indicators: Optional[Callable[[Strategy], dict]] = None
+
+    @property
+    def total_candles(self) -> int:
+        return len(self.candles.get("timestamp", ()))
+
+
+# One extractor per strategy type, picked in create_session so step never probes
+# the strategy for which indicators it has. Values are passed through at full
+# precision; clients round for display.
+def _rsi_indicators(strategy) -> dict:
+    return {
+        "rsi": strategy.rsi.value,
+        "macd_line": None,
+        "macd_signal": None,
+        "macd_histogram": None
+    }
+
+
+def _macd_indicators(strategy) -> dict:
+    macd = strategy.macd
+    return {
+        "rsi": None,
+        "macd_line": macd.macd_line,
+        "macd_signal": macd.signal_line,
+        "macd_histogram": macd.histogram
+    }
+
+
+def _rsi_macd_indicators(strategy) -> dict:
+    macd = strategy.macd
+    return {
+        "rsi": strategy.rsi.value,
+        "macd_line": macd.macd_line,
+        "macd_signal": macd.signal_line,
+        "macd_histogram": macd.histogram
+    }
+
+
+class LiveSimulator(DatabaseClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.sessions: dict[str, SimulatorState] = {}
 
     def create_session(
@@ -45,25 +68,12 @@ class LiveSimulator:
         strategy_params: dict,
         initial_capital: float = 100000.0
     ) -> dict:
-        conn = psycopg2.connect(**self.db_config)
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        cur.execute("""
-            SELECT timestamp, datetime, open, high, low, close, volume
-            FROM candles
-            WHERE symbol = %s AND timeframe = %s
-            ORDER BY timestamp ASC
-        """, [symbol, timeframe])
-
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+        # Column lists (see CANDLE_COLUMNS), streamed straight from the server-side cursor
+        candles = self.get_candles(symbol, timeframe)
 
-        if not rows:
+        if not candles["timestamp"]:
             raise ValueError(f"No candles found for {symbol} {timeframe}")
 
-        candles = [dict(row) for row in rows]
-
         if strategy_type == "RSI":
             config = RSIConfig(
                 period=strategy_params.get("period", 14),
@@ -71,6 +81,7 @@ class LiveSimulator:
                 oversold=strategy_params.get("oversold", 30.0)
             )
             strategy = RSIStrategy(config=config, initial_capital=initial_capital)
+            indicators = _rsi_indicators
         elif strategy_type == "MACD":
             config = MACDConfig(
                 fast_period=strategy_params.get("fast_period", 12),
@@ -78,6 +89,7 @@ class LiveSimulator:
                 signal_period=strategy_params.get("signal_period", 9)
             )
             strategy = MACDStrategy(config=config, initial_capital=initial_capital)
+            indicators = _macd_indicators
         elif strategy_type == "RSI+MACD":
             rsi_config = RSIConfig(
                 period=strategy_params.get("rsi_period", 14),
@@ -90,6 +102,7 @@ class LiveSimulator:
                 signal_period=strategy_params.get("macd_signal", 9)
             )
             strategy = RSIMACDStrategy(rsi_config=rsi_config, macd_config=macd_config, initial_capital=initial_capital)
+            indicators = _rsi_macd_indicators
         else:
             raise ValueError(f"Unknown strategy: {strategy_type}")
 
@@ -99,7 +112,8 @@ class LiveSimulator:
             strategy=strategy,
             symbol=symbol,
             timeframe=timeframe,
-            history=[]
+            history=[],
+            indicators=indicators
         )
 
         self.sessions[session_id] = state
@@ -108,7 +122,7 @@ class LiveSimulator:
             "session_id": session_id,
             "symbol": symbol,
             "timeframe": timeframe,
-            "total_candles": len(candles),
+            "total_candles": state.total_candles,
             "strategy": strategy.get_config()
         }
 
@@ -118,7 +132,7 @@ class LiveSimulator:
 
         state = self.sessions[session_id]
 
-        if state.current_index >= len(state.candles):
+        if state.current_index >= state.total_candles:
             return {
                 "status": "finished",
                 "message": "All candles processed",
@@ -126,52 +140,29 @@ class LiveSimulator:
                 "history": state.history
             }
 
-        row = state.candles[state.current_index]
-        candle = Candle(
-            timestamp=row["timestamp"],
-            datetime=str(row["datetime"]),
-            open=row["open"],
-            high=row["high"],
-            low=row["low"],
-            close=row["close"],
-            volume=row["volume"]
-        )
+        # The columns are in CANDLE_COLUMNS order, which is also Candle's field order
+        i = state.current_index
+        ts, dt, o, h, l, c, v = [values[i] for values in state.candles.values()]
+        candle = Candle(ts, dt, o, h, l, c, v)
 
         signal = state.strategy.on_candle(candle)
         state.strategy.process_signal(signal, candle, quantity=1)
 
-        rsi_value = None
-        macd_line = None
-        macd_signal = None
-        macd_histogram = None
-
-        if hasattr(state.strategy, 'rsi'):
-            rsi_value = state.strategy.rsi.value
-        if hasattr(state.strategy, 'macd'):
-            macd_line = state.strategy.macd.macd_line
-            macd_signal = state.strategy.macd.signal_line
-            macd_histogram = state.strategy.macd.histogram
-
         step_data = {
             "index": state.current_index,
             "candle": {
-                "timestamp": candle.timestamp,
-                "datetime": candle.datetime,
-                "open": candle.open,
-                "high": candle.high,
-                "low": candle.low,
-                "close": candle.close,
-                "volume": candle.volume
+                "timestamp": ts,
+                "datetime": dt,
+                "open": o,
+                "high": h,
+                "low": l,
+                "close": c,
+                "volume": v
             },
-            "signal": signal.name,
+            "signal": SIGNAL_NAMES[signal],
             "position": state.strategy.state.position,
-            "equity": round(state.strategy.state.equity, 2),
-            "indicators": {
-                "rsi": round(rsi_value, 2) if rsi_value is not None else None,
-                "macd_line": round(macd_line, 2) if macd_line is not None else None,
-                "macd_signal": round(macd_signal, 2) if macd_signal is not None else None,
-                "macd_histogram": round(macd_histogram, 2) if macd_histogram is not None else None
-            },
+            "equity": state.strategy.state.equity,
+            "indicators": state.indicators(state.strategy),
             "current_trade": None,
             "last_completed_trade": None
         }
@@ -190,8 +181,8 @@ class LiveSimulator:
                 "entry_price": t.entry_price,
                 "exit_time": t.exit_time,
                 "exit_price": t.exit_price,
-                "pnl": round(t.pnl, 2),
-                "pnl_percent": round(t.pnl_percent, 2)
+                "pnl": t.pnl,
+                "pnl_percent": t.pnl_percent
             }
 
         state.history.append(step_data)
@@ -199,8 +190,8 @@ class LiveSimulator:
 
         return {
             "status": "ok",
-            "remaining": len(state.candles) - state.current_index,
-            "total": len(state.candles),
+            "remaining": state.total_candles - state.current_index,
+            "total": state.total_candles,
             "step": step_data,
             "metrics": state.strategy.get_metrics()
         }
@@ -216,8 +207,8 @@ class LiveSimulator:
             "symbol": state.symbol,
             "timeframe": state.timeframe,
             "current_index": state.current_index,
-            "total_candles": len(state.candles),
-            "remaining": len(state.candles) - state.current_index,
+            "total_candles": state.total_candles,
+            "remaining": state.total_candles - state.current_index,
             "metrics": state.strategy.get_metrics(),
             "history": state.history
         }
@@ -234,7 +225,7 @@ class LiveSimulator:
         return {
             "status": "ok",
             "message": "Session reset",
-            "total_candles": len(state.candles)
+            "total_candles": state.total_candles
         }
 
     def delete_session(self, session_id: str):
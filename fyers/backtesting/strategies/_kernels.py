@@ -0,0 +1,391 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Fallback so the kernels still run (slowly) as plain Python without numba
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
+
+
+@njit(cache=True)
+def ema_rows(close, periods):
+    # One EMA per row, seeded with the SMA of the first `period` closes like EMA.update.
+    # Values before the seed are NaN. The math runs in close's dtype: float32 rows for
+    # the MACD sweep, float64 rows (identical to EMA.update) for the RSI+MACD sweep.
+    n = close.shape[0]
+    out = np.full((periods.shape[0], n), np.nan, dtype=close.dtype)
+    mults = np.empty(periods.shape[0], dtype=close.dtype)
+    for r in range(periods.shape[0]):
+        mults[r] = 2.0 / (periods[r] + 1)
+    for r in range(periods.shape[0]):
+        period = periods[r]
+        if period > n:
+            continue
+        mult = mults[r]
+        total = close[0]
+        for i in range(1, period):
+            total += close[i]
+        # Reading the seed back from `out` rounds it to close's dtype
+        out[r, period - 1] = total / period
+        value = out[r, period - 1]
+        for i in range(period, n):
+            value = (close[i] - value) * mult + value
+            out[r, i] = value
+    return out
+
+
+@njit(cache=True)
+def rsi_vec(close, period):
+    # Whole-series RSI.update: Wilder smoothing seeded with the simple mean of the
+    # first `period` gains and losses.
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain = max(0.0, change)
+        loss = max(0.0, -change)
+        if i < period:
+            avg_gain += gain
+            avg_loss += loss
+            continue
+        if i == period:
+            avg_gain = (avg_gain + gain) / period
+            avg_loss = (avg_loss + loss) / period
+        else:
+            avg_gain += (gain - avg_gain) / period
+            avg_loss += (loss - avg_loss) / period
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+@njit(cache=True)
+def rsi_backtest(price, rsi, overbought, oversold, initial_capital):
+    # One RSIStrategy run (quantity=1) over a precomputed rsi_vec series, so a
+    # threshold sweep computes each period's RSI only once.
+    # Returns (trades, wins, total_pnl, max_drawdown, final_equity).
+    position = 0
+    entry_price = 0.0
+    equity = initial_capital
+    max_equity = initial_capital
+    pnl_sum = 0.0
+    n_trades = 0
+    n_wins = 0
+    worst_dd = 0.0
+
+    for i in range(price.shape[0]):
+        value = rsi[i]
+        if np.isnan(value):
+            continue
+        if value < oversold and position == 0:
+            position = 1
+            entry_price = price[i]
+        elif value > overbought and position == 1:
+            position = 0
+            pnl = price[i] - entry_price
+            pnl_sum += pnl
+            equity += pnl
+            n_trades += 1
+            if pnl > 0:
+                n_wins += 1
+            if equity > max_equity:
+                max_equity = equity
+            dd = ((max_equity - equity) / max_equity) * 100
+            if dd > worst_dd:
+                worst_dd = dd
+
+    return n_trades, n_wins, pnl_sum, worst_dd, equity
+
+
+@njit(cache=True, parallel=True)
+def macd_sweep(price, fast_emas, slow_emas, fast_idx, slow_idx, signals, initial_capital):
+    # Replays MACDStrategy + Strategy.process_signal (quantity=1) for every combination.
+    # Indicators come in as float32 rows; money is accumulated in float64 from `price`.
+    # Combinations are independent, so they are spread across threads with prange.
+    n = price.shape[0]
+    combos = fast_idx.shape[0]
+    trades = np.zeros(combos, dtype=np.int64)
+    wins = np.zeros(combos, dtype=np.int64)
+    total_pnl = np.zeros(combos, dtype=np.float64)
+    max_drawdown = np.zeros(combos, dtype=np.float64)
+    final_equity = np.full(combos, initial_capital, dtype=np.float64)
+
+    for k in prange(combos):
+        fast = fast_emas[fast_idx[k]]
+        slow = slow_emas[slow_idx[k]]
+        period = signals[k]
+        mult = np.float32(2.0 / (period + 1))
+
+        sig_count = 0
+        sig_sum = np.float32(0.0)
+        sig_value = np.float32(0.0)
+        prev_hist = np.float32(0.0)
+        has_prev = False
+
+        position = 0
+        entry_price = 0.0
+        equity = initial_capital
+        max_equity = initial_capital
+        pnl_sum = 0.0
+        n_trades = 0
+        n_wins = 0
+        worst_dd = 0.0
+
+        for i in range(n):
+            if np.isnan(fast[i]) or np.isnan(slow[i]):
+                continue
+            macd = fast[i] - slow[i]
+            if sig_count < period:
+                sig_sum += macd
+                sig_count += 1
+                if sig_count < period:
+                    continue
+                sig_value = np.float32(sig_sum / period)
+            else:
+                sig_value = (macd - sig_value) * mult + sig_value
+            hist = macd - sig_value
+
+            if not has_prev:
+                prev_hist = hist
+                has_prev = True
+                continue
+
+            if prev_hist < 0 and hist >= 0 and position == 0:
+                position = 1
+                entry_price = price[i]
+            elif prev_hist > 0 and hist <= 0 and position == 1:
+                position = 0
+                pnl = price[i] - entry_price
+                pnl_sum += pnl
+                equity += pnl
+                n_trades += 1
+                if pnl > 0:
+                    n_wins += 1
+                if equity > max_equity:
+                    max_equity = equity
+                dd = ((max_equity - equity) / max_equity) * 100
+                if dd > worst_dd:
+                    worst_dd = dd
+            prev_hist = hist
+
+        trades[k] = n_trades
+        wins[k] = n_wins
+        total_pnl[k] = pnl_sum
+        max_drawdown[k] = worst_dd
+        final_equity[k] = equity
+
+    return trades, wins, total_pnl, max_drawdown, final_equity
+
+
+@njit(cache=True, parallel=True)
+def rsi_sweep(price, rsi_rows, row_idx, overboughts, oversolds, initial_capital):
+    # rsi_backtest for every combination; each reads its period's row of rsi_rows.
+    # Combinations are independent, so they are spread across threads with prange.
+    combos = row_idx.shape[0]
+    trades = np.zeros(combos, dtype=np.int64)
+    wins = np.zeros(combos, dtype=np.int64)
+    total_pnl = np.zeros(combos, dtype=np.float64)
+    max_drawdown = np.zeros(combos, dtype=np.float64)
+    final_equity = np.full(combos, initial_capital, dtype=np.float64)
+
+    for k in prange(combos):
+        n_trades, n_wins, pnl_sum, worst_dd, equity = rsi_backtest(
+            price, rsi_rows[row_idx[k]], overboughts[k], oversolds[k], initial_capital
+        )
+        trades[k] = n_trades
+        wins[k] = n_wins
+        total_pnl[k] = pnl_sum
+        max_drawdown[k] = worst_dd
+        final_equity[k] = equity
+
+    return trades, wins, total_pnl, max_drawdown, final_equity
+
+
+@njit(cache=True)
+def rsi_macd_backtest(price, rsi, fast, slow, signal_period, overbought, oversold, initial_capital):
+    # One RSIMACDStrategy run (quantity=1) over a precomputed rsi_vec series and float64
+    # ema_rows fast/slow rows; the signal EMA is streamed here since it depends on the
+    # (fast, slow) pair.
+    # Entries and exits are evaluated as integer masks rather than if/elif chains.
+    # Same return as rsi_backtest.
+    sig_mult = 2 / (signal_period + 1)
+    sig_n = 0
+    sig = 0.0
+    hist = np.nan
+    prev_hist = np.nan
+
+    position = 0
+    entry_price = 0.0
+    equity = initial_capital
+    max_equity = initial_capital
+    pnl_sum = 0.0
+    n_trades = 0
+    n_wins = 0
+    worst_dd = 0.0
+
+    for i in range(price.shape[0]):
+        x = price[i]
+        macd = fast[i] - slow[i]
+        if not np.isnan(macd):
+            if sig_n < signal_period:
+                sig += macd
+                sig_n += 1
+                if sig_n == signal_period:
+                    sig = sig / signal_period
+                    hist = macd - sig
+            else:
+                sig = (macd - sig) * sig_mult + sig
+                hist = macd - sig
+
+        # NaN compares false, so every mask is 0 until RSI, hist and prev_hist are all ready
+        r = rsi[i]
+        ready = (r == r) & (hist == hist) & (prev_hist == prev_hist)
+        macd_bull = (prev_hist < 0.0) & (hist >= 0.0)
+        macd_bear = (prev_hist > 0.0) & (hist <= 0.0)
+        do_buy = int(ready & ((r < oversold) | macd_bull) & (position == 0))
+        do_sell = int(ready & ((r > overbought) | macd_bear) & (position == 1))
+
+        position = position + do_buy - do_sell
+        entry_price = do_buy * x + (1 - do_buy) * entry_price
+        pnl = do_sell * (x - entry_price)
+        pnl_sum += pnl
+        equity += pnl
+        n_trades += do_sell
+        n_wins += do_sell & int(pnl > 0)
+        max_equity = max(max_equity, equity)
+        worst_dd = max(worst_dd, ((max_equity - equity) / max_equity) * 100)
+        prev_hist = hist
+
+    return n_trades, n_wins, pnl_sum, worst_dd, equity
+
+
+@njit(cache=True, parallel=True)
+def rsi_macd_sweep(price, rsi_rows, fast_rows, slow_rows, overbought, oversold,
+                   rsi_idx, fast_idx, slow_idx, signals, initial_capital):
+    # rsi_macd_backtest for every combination; each reads its RSI, fast and slow rows.
+    # Combinations are independent, so they are spread across threads with prange.
+    combos = rsi_idx.shape[0]
+    trades = np.zeros(combos, dtype=np.int64)
+    wins = np.zeros(combos, dtype=np.int64)
+    total_pnl = np.zeros(combos, dtype=np.float64)
+    max_drawdown = np.zeros(combos, dtype=np.float64)
+    final_equity = np.full(combos, initial_capital, dtype=np.float64)
+
+    for k in prange(combos):
+        n_trades, n_wins, pnl_sum, worst_dd, equity = rsi_macd_backtest(
+            price, rsi_rows[rsi_idx[k]], fast_rows[fast_idx[k]], slow_rows[slow_idx[k]],
+            signals[k], overbought, oversold, initial_capital
+        )
+        trades[k] = n_trades
+        wins[k] = n_wins
+        total_pnl[k] = pnl_sum
+        max_drawdown[k] = worst_dd
+        final_equity[k] = equity
+
+    return trades, wins, total_pnl, max_drawdown, final_equity
+
+
+# Layout of the float64 state vector used by rsi_macd_step
+S_FAST, S_SLOW, S_SIG = 0, 1, 2
+S_FAST_N, S_SLOW_N, S_SIG_N = 3, 4, 5
+S_PREV_CLOSE, S_RSI, S_RSI_N = 6, 7, 8
+S_MACD, S_HIST = 9, 10
+S_FAST_P, S_SLOW_P, S_SIG_P, S_RSI_P = 11, 12, 13, 14
+S_AVG_GAIN, S_AVG_LOSS = 15, 16
+S_FAST_M, S_SLOW_M, S_SIG_M = 17, 18, 19
+S_SIZE = 20
+
+
+def rsi_macd_state(rsi_period: int, fast_period: int, slow_period: int, signal_period: int) -> np.ndarray:
+    state = np.zeros(S_SIZE, dtype=np.float64)
+    state[S_FAST_P] = fast_period
+    state[S_SLOW_P] = slow_period
+    state[S_SIG_P] = signal_period
+    state[S_RSI_P] = rsi_period
+    # EMA multipliers are fixed per strategy, so they are computed once here
+    state[S_FAST_M] = 2 / (fast_period + 1)
+    state[S_SLOW_M] = 2 / (slow_period + 1)
+    state[S_SIG_M] = 2 / (signal_period + 1)
+    reset_rsi_macd_state(state)
+    return state
+
+
+def reset_rsi_macd_state(state: np.ndarray):
+    state[:S_FAST_P] = 0.0
+    state[S_PREV_CLOSE] = np.nan
+    state[S_RSI] = np.nan
+    state[S_MACD] = np.nan
+    state[S_HIST] = np.nan
+    state[S_SIG] = np.nan
+    state[S_AVG_GAIN] = 0.0
+    state[S_AVG_LOSS] = 0.0
+
+
+@njit(cache=True, inline="always")
+def _ema_step(state, value_slot, count_slot, period, mult, x):
+    # Same recurrence as EMA.update: SMA seed over the first `period` inputs, then EMA.
+    count = state[count_slot]
+    if count < period:
+        state[value_slot] = (state[value_slot] if count > 0 else 0.0) + x
+        count += 1
+        state[count_slot] = count
+        if count < period:
+            return np.nan
+        state[value_slot] = state[value_slot] / period
+        return state[value_slot]
+    state[value_slot] = (x - state[value_slot]) * mult + state[value_slot]
+    return state[value_slot]
+
+
+@njit(cache=True)
+def rsi_macd_step(close, state):
+    # One call per candle updates RSI and MACD together; NaN means "not ready yet".
+    fast = _ema_step(state, S_FAST, S_FAST_N, state[S_FAST_P], state[S_FAST_M], close)
+    slow = _ema_step(state, S_SLOW, S_SLOW_N, state[S_SLOW_P], state[S_SLOW_M], close)
+    if not np.isnan(fast) and not np.isnan(slow):
+        macd = fast - slow
+        state[S_MACD] = macd
+        signal = _ema_step(state, S_SIG, S_SIG_N, state[S_SIG_P], state[S_SIG_M], macd)
+        if not np.isnan(signal):
+            state[S_HIST] = macd - signal
+
+    prev_close = state[S_PREV_CLOSE]
+    if not np.isnan(prev_close):
+        period = state[S_RSI_P]
+        change = close - prev_close
+        gain = max(0.0, change)
+        loss = max(0.0, -change)
+        n = state[S_RSI_N]
+        if n < period:
+            state[S_AVG_GAIN] += gain
+            state[S_AVG_LOSS] += loss
+            n += 1
+            state[S_RSI_N] = n
+            if n == period:
+                state[S_AVG_GAIN] /= period
+                state[S_AVG_LOSS] /= period
+        else:
+            # Same Wilder recurrence as RSI.update
+            state[S_AVG_GAIN] += (gain - state[S_AVG_GAIN]) / period
+            state[S_AVG_LOSS] += (loss - state[S_AVG_LOSS]) / period
+        if n >= period:
+            avg_loss = state[S_AVG_LOSS]
+            if avg_loss == 0:
+                state[S_RSI] = 100.0
+            else:
+                state[S_RSI] = 100 - (100 / (1 + state[S_AVG_GAIN] / avg_loss))
+    state[S_PREV_CLOSE] = close
+
+    return state[S_RSI], state[S_MACD], state[S_SIG] if state[S_SIG_N] >= state[S_SIG_P] else np.nan, state[S_HIST]
@@ -3,6 +3,11 @@ from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 
+import numpy as np
+
+# Curve capacity for strategies stepped without prepare() (simulator, sweeps); doubles as needed
+CURVE_GROWTH_MIN = 1024
+
 
 class Signal(Enum):
     HOLD = 0
@@ -10,7 +15,7 @@ class Signal(Enum):
     SELL = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     timestamp: int
     datetime: str
@@ -21,7 +26,7 @@ class Candle:
     volume: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     entry_time: str
     entry_price: float
@@ -38,16 +43,34 @@ class Trade:
         self.pnl_percent = ((self.exit_price - self.entry_price) / self.entry_price) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyState:
     position: int = 0  # 0 = flat, 1 = long
     trades: list = field(default_factory=list)
     current_trade: Optional[Trade] = None
     equity: float = 100000.0
     initial_equity: float = 100000.0
-    equity_curve: list = field(default_factory=list)
     max_equity: float = 100000.0
-    drawdowns: list = field(default_factory=list)
+    # Per-candle curves; only the first n_points entries are filled
+    timestamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    equity_curve: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    drawdowns: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    n_points: int = 0
+
+    def reserve(self, n_candles: int):
+        size = self.n_points + n_candles
+        if size <= len(self.equity_curve):
+            return
+        timestamps = np.empty(size, dtype=np.int64)
+        equity_curve = np.empty(size, dtype=np.float64)
+        drawdowns = np.empty(size, dtype=np.float64)
+        n = self.n_points
+        timestamps[:n] = self.timestamps[:n]
+        equity_curve[:n] = self.equity_curve[:n]
+        drawdowns[:n] = self.drawdowns[:n]
+        self.timestamps = timestamps
+        self.equity_curve = equity_curve
+        self.drawdowns = drawdowns
 
 
 class Strategy(ABC):
@@ -70,6 +93,10 @@ class Strategy(ABC):
     def get_config(self) -> dict:
         pass
 
+    def prepare(self, n_candles: int):
+        # Size the equity/drawdown curves up front so process_signal never reallocates
+        self.state.reserve(n_candles)
+
     def process_signal(self, signal: Signal, candle: Candle, quantity: int = 1):
         if signal == Signal.BUY and self.state.position == 0:
             self.state.position = 1
@@ -87,19 +114,18 @@ class Strategy(ABC):
                 self.state.trades.append(self.state.current_trade)
                 self.state.current_trade = None
 
-        self.state.equity_curve.append({
-            "datetime": candle.datetime,
-            "equity": self.state.equity
-        })
-
         if self.state.equity > self.state.max_equity:
             self.state.max_equity = self.state.equity
 
         drawdown = ((self.state.max_equity - self.state.equity) / self.state.max_equity) * 100
-        self.state.drawdowns.append({
-            "datetime": candle.datetime,
-            "drawdown": drawdown
-        })
+
+        i = self.state.n_points
+        if i == len(self.state.equity_curve):
+            self.state.reserve(max(i, CURVE_GROWTH_MIN))
+        self.state.timestamps[i] = candle.timestamp
+        self.state.equity_curve[i] = self.state.equity
+        self.state.drawdowns[i] = drawdown
+        self.state.n_points = i + 1
 
     def get_metrics(self) -> dict:
         if not self.state.trades:
@@ -116,19 +142,23 @@ class Strategy(ABC):
                 "return_percent": 0.0
             }
 
-        winning = [t for t in self.state.trades if t.pnl > 0]
-        losing = [t for t in self.state.trades if t.pnl <= 0]
-        total_pnl = sum(t.pnl for t in self.state.trades)
-        max_dd = max(d["drawdown"] for d in self.state.drawdowns) if self.state.drawdowns else 0
+        # One float column of trade P&L instead of filtered lists of Trade objects.
+        # cumsum adds in trade order like the sweep kernels, so totals stay bit-identical.
+        trades = self.state.trades
+        pnl = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+        n_trades = len(pnl)
+        n_winning = int(np.count_nonzero(pnl > 0))
+        total_pnl = float(np.cumsum(pnl)[-1])
+        max_dd = float(self.state.drawdowns[:self.state.n_points].max()) if self.state.n_points else 0
 
         return {
-            "total_trades": len(self.state.trades),
-            "winning_trades": len(winning),
-            "losing_trades": len(losing),
-            "win_rate": (len(winning) / len(self.state.trades)) * 100 if self.state.trades else 0,
+            "total_trades": n_trades,
+            "winning_trades": n_winning,
+            "losing_trades": n_trades - n_winning,
+            "win_rate": (n_winning / n_trades) * 100,
             "total_pnl": round(total_pnl, 2),
             "total_pnl_percent": round((total_pnl / self.state.initial_equity) * 100, 2),
-            "avg_pnl": round(total_pnl / len(self.state.trades), 2) if self.state.trades else 0,
+            "avg_pnl": round(total_pnl / n_trades, 2),
             "max_drawdown": round(max_dd, 2),
             "final_equity": round(self.state.equity, 2),
             "return_percent": round(((self.state.equity - self.state.initial_equity) / self.state.initial_equity) * 100, 2)
@@ -12,30 +12,36 @@ class MACDConfig:
 
 
 class EMA:
+    __slots__ = ("period", "multiplier", "value", "count", "sum", "update")
+
     def __init__(self, period: int):
         self.period = period
         self.multiplier = 2 / (period + 1)
-        self.value: Optional[float] = None
-        self.count = 0
-        self.sum = 0.0
+        self.reset()
+
+    # update is rebound per phase so the steady state carries no seeding check
+    def _update_seed(self, price: float) -> Optional[float]:
+        self.sum += price
+        self.count += 1
+        if self.count == self.period:
+            self.value = self.sum / self.period
+            self.update = self._update_run
+        return self.value
 
-    def update(self, price: float) -> Optional[float]:
-        if self.value is None:
-            self.sum += price
-            self.count += 1
-            if self.count == self.period:
-                self.value = self.sum / self.period
-        else:
-            self.value = (price - self.value) * self.multiplier + self.value
+    def _update_run(self, price: float) -> float:
+        self.value = (price - self.value) * self.multiplier + self.value
         return self.value
 
     def reset(self):
-        self.value = None
+        self.value: Optional[float] = None
         self.count = 0
         self.sum = 0.0
+        self.update = self._update_seed
 
 
 class MACD:
+    __slots__ = ("config", "fast_ema", "slow_ema", "signal_ema", "macd_line", "signal_line", "histogram")
+
     def __init__(self, config: MACDConfig = None):
         self.config = config or MACDConfig()
         self.fast_ema = EMA(self.config.fast_period)
@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 from typing import Optional
-from collections import deque
 
 from .base import Strategy, Signal, Candle, StrategyState
 
@@ -13,39 +12,59 @@ class RSIConfig:
 
 
 class RSI:
+    __slots__ = ("config", "avg_gain", "avg_loss", "count", "prev_close", "value", "update")
+
     def __init__(self, config: RSIConfig = None):
         self.config = config or RSIConfig()
-        self.gains = deque(maxlen=self.config.period)
-        self.losses = deque(maxlen=self.config.period)
-        self.prev_close: Optional[float] = None
-        self.value: Optional[float] = None
+        # Wilder smoothing: simple mean of the first `period` changes, then
+        # avg += (x - avg) / period, so each update is O(1)
+        self.reset()
 
-    def update(self, close: float) -> Optional[float]:
-        if self.prev_close is not None:
-            change = close - self.prev_close
-            gain = max(0, change)
-            loss = max(0, -change)
-            self.gains.append(gain)
-            self.losses.append(loss)
-
-            if len(self.gains) == self.config.period:
-                avg_gain = sum(self.gains) / self.config.period
-                avg_loss = sum(self.losses) / self.config.period
+    # update is rebound per phase (first close, seeding, steady state) so each
+    # candle runs only the branch that applies to it
+    def _update_first(self, close: float) -> Optional[float]:
+        self.prev_close = close
+        self.update = self._update_seed
+        return self.value
 
-                if avg_loss == 0:
-                    self.value = 100.0
-                else:
-                    rs = avg_gain / avg_loss
-                    self.value = 100 - (100 / (1 + rs))
+    def _update_seed(self, close: float) -> Optional[float]:
+        change = close - self.prev_close
+        self.avg_gain += max(0.0, change)
+        self.avg_loss += max(0.0, -change)
+        self.count += 1
+        period = self.config.period
+        if self.count == period:
+            self.avg_gain /= period
+            self.avg_loss /= period
+            if self.avg_loss == 0:
+                self.value = 100.0
+            else:
+                rs = self.avg_gain / self.avg_loss
+                self.value = 100 - (100 / (1 + rs))
+            self.update = self._update_run
+        self.prev_close = close
+        return self.value
 
+    def _update_run(self, close: float) -> float:
+        period = self.config.period
+        change = close - self.prev_close
+        self.avg_gain += (max(0.0, change) - self.avg_gain) / period
+        self.avg_loss += (max(0.0, -change) - self.avg_loss) / period
+        if self.avg_loss == 0:
+            self.value = 100.0
+        else:
+            rs = self.avg_gain / self.avg_loss
+            self.value = 100 - (100 / (1 + rs))
         self.prev_close = close
         return self.value
 
     def reset(self):
-        self.gains.clear()
-        self.losses.clear()
-        self.prev_close = None
-        self.value = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+        self.prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+        self.update = self._update_first
 
 
 class RSIStrategy(Strategy):
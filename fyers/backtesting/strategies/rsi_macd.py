@@ -1,8 +1,10 @@
+from math import isnan
 from typing import Optional
 
 from .base import Strategy, Signal, Candle, StrategyState
 from .rsi import RSI, RSIConfig
 from .macd import MACD, MACDConfig
+from ._kernels import rsi_macd_state, reset_rsi_macd_state, rsi_macd_step
 
 
 class RSIMACDStrategy(Strategy):
@@ -15,13 +17,25 @@ class RSIMACDStrategy(Strategy):
         super().__init__(initial_capital)
         self.rsi_config = rsi_config or RSIConfig()
         self.macd_config = macd_config or MACDConfig()
+        # rsi/macd only mirror the latest values; the fused kernel owns the indicator state
         self.rsi = RSI(self.rsi_config)
         self.macd = MACD(self.macd_config)
+        self.indicator_state = rsi_macd_state(
+            self.rsi_config.period,
+            self.macd_config.fast_period,
+            self.macd_config.slow_period,
+            self.macd_config.signal_period
+        )
         self.prev_histogram: Optional[float] = None
 
     def on_candle(self, candle: Candle) -> Signal:
-        rsi_value = self.rsi.update(candle.close)
-        macd_line, signal_line, histogram = self.macd.update(candle.close)
+        rsi_value, macd_line, signal_line, histogram = rsi_macd_step(candle.close, self.indicator_state)
+        rsi_value = None if isnan(rsi_value) else rsi_value
+        histogram = None if isnan(histogram) else histogram
+        self.rsi.value = rsi_value
+        self.macd.macd_line = None if isnan(macd_line) else macd_line
+        self.macd.signal_line = None if isnan(signal_line) else signal_line
+        self.macd.histogram = histogram
 
         if rsi_value is None or histogram is None or self.prev_histogram is None:
             self.prev_histogram = histogram
@@ -49,6 +63,7 @@ class RSIMACDStrategy(Strategy):
     def reset(self):
         self.rsi.reset()
         self.macd.reset()
+        reset_rsi_macd_state(self.indicator_state)
         self.prev_histogram = None
         self.state = StrategyState(
             equity=self.state.initial_equity,
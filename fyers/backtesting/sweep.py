@@ -0,0 +1,316 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from .strategies._kernels import (
+    NUMBA_AVAILABLE, ema_rows, macd_sweep, rsi_macd_state, rsi_macd_step, rsi_macd_sweep,
+    rsi_sweep, rsi_vec
+)
+
+
+# Grids smaller than this run in-process; starting workers would cost more than the sweep
+PARALLEL_MIN_COMBOS = 2048
+
+_worker_inputs = None
+_worker_shms = None
+
+
+MACD_SWEEP_DTYPE = np.dtype([
+    ("fast_period", "i2"),
+    ("slow_period", "i2"),
+    ("signal_period", "i2"),
+    ("total_pnl", "f8"),
+    ("total_pnl_percent", "f8"),
+    ("win_rate", "f8"),
+    ("total_trades", "i4"),
+    ("winning_trades", "i4"),
+    ("losing_trades", "i4"),
+    ("avg_pnl", "f8"),
+    ("max_drawdown", "f8"),
+    ("final_equity", "f8"),
+    ("return_percent", "f8"),
+])
+
+RSI_SWEEP_DTYPE = np.dtype([
+    ("period", "i2"),
+    ("overbought", "f8"),
+    ("oversold", "f8"),
+    ("total_pnl", "f8"),
+    ("total_pnl_percent", "f8"),
+    ("win_rate", "f8"),
+    ("total_trades", "i4"),
+    ("winning_trades", "i4"),
+    ("losing_trades", "i4"),
+    ("avg_pnl", "f8"),
+    ("max_drawdown", "f8"),
+    ("final_equity", "f8"),
+    ("return_percent", "f8"),
+])
+
+RSI_MACD_SWEEP_DTYPE = np.dtype([
+    ("rsi_period", "i2"),
+    ("macd_fast", "i2"),
+    ("macd_slow", "i2"),
+    ("macd_signal", "i2"),
+    ("total_pnl", "f8"),
+    ("total_pnl_percent", "f8"),
+    ("win_rate", "f8"),
+    ("total_trades", "i4"),
+    ("winning_trades", "i4"),
+    ("losing_trades", "i4"),
+    ("avg_pnl", "f8"),
+    ("max_drawdown", "f8"),
+    ("final_equity", "f8"),
+    ("return_percent", "f8"),
+])
+
+
+def _fill_metrics(results: np.ndarray, trades, wins, total_pnl, max_dd, equity, initial_capital: float):
+    # Column-wise version of Strategy.get_metrics; combos without trades report zeros
+    has_trades = trades > 0
+    safe_trades = np.maximum(trades, 1)
+    results["total_trades"] = trades
+    results["winning_trades"] = wins
+    results["losing_trades"] = trades - wins
+    results["win_rate"] = np.where(has_trades, wins / safe_trades * 100, 0.0)
+    results["total_pnl"] = np.where(has_trades, np.round(total_pnl, 2), 0.0)
+    results["total_pnl_percent"] = np.where(has_trades, np.round(total_pnl / initial_capital * 100, 2), 0.0)
+    results["avg_pnl"] = np.where(has_trades, np.round(total_pnl / safe_trades, 2), 0.0)
+    results["max_drawdown"] = np.where(has_trades, np.round(max_dd, 2), 0.0)
+    results["final_equity"] = np.where(has_trades, np.round(equity, 2), equity)
+    results["return_percent"] = np.where(
+        has_trades, np.round((equity - initial_capital) / initial_capital * 100, 2), 0.0
+    )
+
+
+def _share_table(table):
+    # Arrays are published once through shared memory and workers map them by name;
+    # scalars are small and pass through as they are
+    if not isinstance(table, np.ndarray):
+        return None, table
+    shm = shared_memory.SharedMemory(create=True, size=max(table.nbytes, 1))
+    np.ndarray(table.shape, dtype=table.dtype, buffer=shm.buf)[...] = table
+    return shm, (shm.name, table.shape, table.dtype.str)
+
+
+def _init_worker(kernel, table_specs, initial_capital):
+    global _worker_inputs, _worker_shms
+    _worker_shms = []
+    tables = []
+    for spec in table_specs:
+        if isinstance(spec, tuple):
+            name, shape, dtype = spec
+            shm = shared_memory.SharedMemory(name=name)
+            _worker_shms.append(shm)
+            spec = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        tables.append(spec)
+    _worker_inputs = (kernel, tuple(tables), initial_capital)
+
+
+def _sweep_chunk(chunk):
+    kernel, tables, initial_capital = _worker_inputs
+    return kernel(*tables, *chunk, initial_capital)
+
+
+def _parallel_sweep(kernel, tables, combo_arrays, initial_capital, workers):
+    # kernel(*tables, *combo_arrays, initial_capital) is run on slices of the
+    # per-combination arrays and the result columns are stitched back together.
+    # The price/indicator tables are shared with the workers rather than copied.
+    n_chunks = workers * 4
+    chunks = zip(*(np.array_split(column, n_chunks) for column in combo_arrays))
+    shared = [_share_table(table) for table in tables]
+    try:
+        # Spawned rather than forked workers: sweeps run inside the API process, whose
+        # other threads (request pool, JIT warm-up) may hold locks at fork time.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(kernel, [spec for _, spec in shared], initial_capital)
+        ) as ex:
+            parts = list(ex.map(_sweep_chunk, chunks))
+    finally:
+        for shm, _ in shared:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+def _use_process_pool(workers: Optional[int], combos: int) -> tuple[bool, int]:
+    # With numba the kernels already spread combinations over all cores with prange
+    # (and forking after its thread pool has started is unsafe), so the process pool
+    # is only the fallback for the pure-Python kernels.
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return not NUMBA_AVAILABLE and workers > 1 and combos >= PARALLEL_MIN_COMBOS, workers
+
+
+def result_rows(results: np.ndarray) -> list[dict]:
+    names = results.dtype.names
+    return [dict(zip(names, row)) for row in results.tolist()]
+
+
+def result_columns(results: np.ndarray) -> dict:
+    return {name: results[name].tolist() for name in results.dtype.names}
+
+
+def run_macd_sweep(
+    closes: list,
+    fast_periods: range,
+    slow_periods: range,
+    signal_periods: range,
+    initial_capital: float = 100000.0,
+    workers: Optional[int] = None
+) -> np.ndarray:
+    # Indicator math runs in float32; trade P&L is accumulated in float64 from the raw prices.
+    price = np.asarray(closes, dtype=np.float64)
+    close = price.astype(np.float32)
+
+    fasts = np.asarray(fast_periods, dtype=np.int64)
+    slows = np.asarray(slow_periods, dtype=np.int64)
+    signals = np.asarray(signal_periods, dtype=np.int64)
+
+    fast_emas = ema_rows(close, fasts)
+    slow_emas = ema_rows(close, slows)
+
+    fast_idx, slow_idx, signal_idx = np.meshgrid(
+        np.arange(len(fasts)), np.arange(len(slows)), np.arange(len(signals)), indexing="ij"
+    )
+    fast_idx = fast_idx.ravel()
+    slow_idx = slow_idx.ravel()
+    combo_signals = signals[signal_idx.ravel()]
+
+    use_pool, workers = _use_process_pool(workers, len(combo_signals))
+    if use_pool:
+        trades, wins, total_pnl, max_dd, equity = _parallel_sweep(
+            macd_sweep, (price, fast_emas, slow_emas), (fast_idx, slow_idx, combo_signals),
+            float(initial_capital), workers
+        )
+    else:
+        trades, wins, total_pnl, max_dd, equity = macd_sweep(
+            price, fast_emas, slow_emas, fast_idx, slow_idx, combo_signals, float(initial_capital)
+        )
+
+    results = np.empty(len(combo_signals), dtype=MACD_SWEEP_DTYPE)
+    results["fast_period"] = fasts[fast_idx]
+    results["slow_period"] = slows[slow_idx]
+    results["signal_period"] = combo_signals
+    _fill_metrics(results, trades, wins, total_pnl, max_dd, equity, float(initial_capital))
+    return results
+
+
+def run_rsi_sweep(
+    closes: list,
+    periods: range,
+    overboughts: list,
+    oversolds: list,
+    initial_capital: float = 100000.0,
+    workers: Optional[int] = None
+) -> np.ndarray:
+    # Everything runs in float64, so metrics match RSIStrategy exactly. The RSI
+    # series depends only on the period and is reused for every threshold pair.
+    price = np.asarray(closes, dtype=np.float64)
+    periods = np.asarray(periods, dtype=np.int64)
+    rsi_rows = np.empty((len(periods), len(price)), dtype=np.float64)
+    for r, period in enumerate(periods):
+        rsi_rows[r] = rsi_vec(price, period)
+
+    row_idx, ob_idx, os_idx = np.meshgrid(
+        np.arange(len(periods)), np.arange(len(overboughts)), np.arange(len(oversolds)), indexing="ij"
+    )
+    row_idx = row_idx.ravel()
+    combo_overboughts = np.asarray(overboughts, dtype=np.float64)[ob_idx.ravel()]
+    combo_oversolds = np.asarray(oversolds, dtype=np.float64)[os_idx.ravel()]
+
+    use_pool, workers = _use_process_pool(workers, len(row_idx))
+    if use_pool:
+        trades, wins, total_pnl, max_dd, equity = _parallel_sweep(
+            rsi_sweep, (price, rsi_rows), (row_idx, combo_overboughts, combo_oversolds),
+            float(initial_capital), workers
+        )
+    else:
+        trades, wins, total_pnl, max_dd, equity = rsi_sweep(
+            price, rsi_rows, row_idx, combo_overboughts, combo_oversolds, float(initial_capital)
+        )
+
+    results = np.empty(len(row_idx), dtype=RSI_SWEEP_DTYPE)
+    results["period"] = periods[row_idx]
+    results["overbought"] = combo_overboughts
+    results["oversold"] = combo_oversolds
+    _fill_metrics(results, trades, wins, total_pnl, max_dd, equity, float(initial_capital))
+    return results
+
+
+def run_rsi_macd_sweep(
+    closes: list,
+    rsi_periods: range,
+    fast_periods: range,
+    slow_periods: range,
+    signal_periods: range,
+    overbought: float,
+    oversold: float,
+    initial_capital: float = 100000.0,
+    workers: Optional[int] = None
+) -> np.ndarray:
+    # float64 throughout so metrics match RSIMACDStrategy. RSI and the fast/slow EMAs
+    # are computed once per period; only the signal EMA is per combination.
+    price = np.asarray(closes, dtype=np.float64)
+    rsi_periods = np.asarray(rsi_periods, dtype=np.int64)
+    fasts = np.asarray(fast_periods, dtype=np.int64)
+    slows = np.asarray(slow_periods, dtype=np.int64)
+    signals = np.asarray(signal_periods, dtype=np.int64)
+
+    rsi_rows = np.empty((len(rsi_periods), len(price)), dtype=np.float64)
+    for r, period in enumerate(rsi_periods):
+        rsi_rows[r] = rsi_vec(price, period)
+    fast_rows = ema_rows(price, fasts)
+    slow_rows = ema_rows(price, slows)
+
+    rsi_idx, fast_idx, slow_idx, signal_idx = np.meshgrid(
+        np.arange(len(rsi_periods)), np.arange(len(fasts)), np.arange(len(slows)), np.arange(len(signals)),
+        indexing="ij"
+    )
+    rsi_idx = rsi_idx.ravel()
+    fast_idx = fast_idx.ravel()
+    slow_idx = slow_idx.ravel()
+    combo_signals = signals[signal_idx.ravel()]
+
+    tables = (price, rsi_rows, fast_rows, slow_rows, float(overbought), float(oversold))
+    use_pool, workers = _use_process_pool(workers, len(combo_signals))
+    if use_pool:
+        trades, wins, total_pnl, max_dd, equity = _parallel_sweep(
+            rsi_macd_sweep, tables, (rsi_idx, fast_idx, slow_idx, combo_signals),
+            float(initial_capital), workers
+        )
+    else:
+        trades, wins, total_pnl, max_dd, equity = rsi_macd_sweep(
+            *tables, rsi_idx, fast_idx, slow_idx, combo_signals, float(initial_capital)
+        )
+
+    results = np.empty(len(combo_signals), dtype=RSI_MACD_SWEEP_DTYPE)
+    results["rsi_period"] = rsi_periods[rsi_idx]
+    results["macd_fast"] = fasts[fast_idx]
+    results["macd_slow"] = slows[slow_idx]
+    results["macd_signal"] = combo_signals
+    _fill_metrics(results, trades, wins, total_pnl, max_dd, equity, float(initial_capital))
+    return results
+
+
+def warm_up():
+    """Compile (or load from numba's on-disk cache) every kernel the API calls.
+
+    The sweeps are driven with a tiny series so the exact argument types of real
+    requests are specialised; the first user request then pays no JIT latency.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    closes = np.linspace(100.0, 110.0, 64)
+    run_macd_sweep(closes, range(3, 4), range(5, 6), range(2, 3), workers=1)
+    run_rsi_sweep(closes, range(3, 4), [70.0], [30.0], workers=1)
+    run_rsi_macd_sweep(closes, range(3, 4), range(3, 4), range(5, 6), range(2, 3), 70.0, 30.0, workers=1)
+    rsi_macd_step(100.0, rsi_macd_state(3, 3, 5, 2))
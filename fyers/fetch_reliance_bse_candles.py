@@ -5,9 +5,8 @@ from urllib.parse import urlparse, parse_qs
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from datetime import datetime, timedelta
 
-import psycopg2
-from psycopg2.extras import execute_values
-# Using psycopg2-binary which doesn't require compilation
+import psycopg
+# Using psycopg[binary] which doesn't require compilation
 from fyers_apiv3 import fyersModel
 from dotenv import load_dotenv
 
@@ -58,14 +57,14 @@ def get_auth_code(session):
 
 
 def create_database():
-    conn = psycopg2.connect(
+    conn = psycopg.connect(
         host="localhost",
         port=5432,
         user="trader",
         password="trader123",
-        dbname="postgres"
+        dbname="postgres",
+        autocommit=True
     )
-    conn.autocommit = True
     cur = conn.cursor()
     cur.execute("SELECT 1 FROM pg_database WHERE datname = 'fyers'")
     if not cur.fetchone():
@@ -79,25 +78,27 @@ def create_database():
 
 def create_table(conn):
     cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS candles (
-            id SERIAL PRIMARY KEY,
-            symbol VARCHAR(50) NOT NULL,
-            timeframe VARCHAR(10) NOT NULL,
-            timestamp BIGINT NOT NULL,
-            datetime TIMESTAMP NOT NULL,
-            open DOUBLE PRECISION NOT NULL,
-            high DOUBLE PRECISION NOT NULL,
-            low DOUBLE PRECISION NOT NULL,
-            close DOUBLE PRECISION NOT NULL,
-            volume BIGINT NOT NULL,
-            UNIQUE(symbol, timeframe, timestamp)
-        )
-    """)
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS idx_candles_symbol_timeframe
-        ON candles(symbol, timeframe)
-    """)
+    # Both DDL statements go out in one round trip
+    with conn.pipeline():
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS candles (
+                id SERIAL PRIMARY KEY,
+                symbol VARCHAR(50) NOT NULL,
+                timeframe VARCHAR(10) NOT NULL,
+                timestamp BIGINT NOT NULL,
+                datetime TIMESTAMP NOT NULL,
+                open DOUBLE PRECISION NOT NULL,
+                high DOUBLE PRECISION NOT NULL,
+                low DOUBLE PRECISION NOT NULL,
+                close DOUBLE PRECISION NOT NULL,
+                volume BIGINT NOT NULL,
+                UNIQUE(symbol, timeframe, timestamp)
+            )
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_candles_symbol_timeframe
+            ON candles(symbol, timeframe)
+        """)
     conn.commit()
     cur.close()
     log.info("Table 'candles' ready")
@@ -132,43 +133,57 @@ def save_candles(conn, symbol, timeframe_name, candles):
         return
 
     cur = conn.cursor()
-    seen = set()
-    rows = []
-    for c in candles:
-        ts = c[0]
-        if ts in seen:
-            continue
-        seen.add(ts)
-        dt = datetime.fromtimestamp(ts)
-        rows.append((
-            symbol,
-            timeframe_name,
-            ts,
-            dt,
-            c[1],  # open
-            c[2],  # high
-            c[3],  # low
-            c[4],  # close
-            c[5]   # volume
-        ))
-
-    execute_values(
-        cur,
-        """
+    cur.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS candles_stage (
+            symbol VARCHAR(50) NOT NULL,
+            timeframe VARCHAR(10) NOT NULL,
+            timestamp BIGINT NOT NULL,
+            datetime TIMESTAMP NOT NULL,
+            open DOUBLE PRECISION NOT NULL,
+            high DOUBLE PRECISION NOT NULL,
+            low DOUBLE PRECISION NOT NULL,
+            close DOUBLE PRECISION NOT NULL,
+            volume BIGINT NOT NULL
+        ) ON COMMIT DELETE ROWS
+    """)
+    # Bulk-load into the staging table with binary COPY, then upsert in one statement
+    with cur.copy(
+        "COPY candles_stage (symbol, timeframe, timestamp, datetime, open, high, low, close, volume) "
+        "FROM STDIN WITH (FORMAT BINARY)"
+    ) as copy:
+        copy.set_types(["varchar", "varchar", "int8", "timestamp", "float8", "float8", "float8", "float8", "int8"])
+        for c in candles:
+            ts = c[0]
+            copy.write_row((
+                symbol,
+                timeframe_name,
+                ts,
+                datetime.fromtimestamp(ts),
+                c[1],  # open
+                c[2],  # high
+                c[3],  # low
+                c[4],  # close
+                c[5]   # volume
+            ))
+    # An upsert may not touch the same row twice, so repeated timestamps in the
+    # batch are collapsed here, keeping the first one received
+    cur.execute("""
         INSERT INTO candles (symbol, timeframe, timestamp, datetime, open, high, low, close, volume)
-        VALUES %s
+        SELECT DISTINCT ON (timestamp)
+            symbol, timeframe, timestamp, datetime, open, high, low, close, volume
+        FROM candles_stage
+        ORDER BY timestamp, ctid
         ON CONFLICT (symbol, timeframe, timestamp) DO UPDATE SET
             open = EXCLUDED.open,
             high = EXCLUDED.high,
             low = EXCLUDED.low,
             close = EXCLUDED.close,
             volume = EXCLUDED.volume
-        """,
-        rows
-    )
+    """)
+    saved = cur.rowcount
     conn.commit()
     cur.close()
-    log.info(f"Saved {len(rows)} candles for {timeframe_name}")
+    log.info(f"Saved {saved} candles for {timeframe_name}")
 
 
 def main():
@@ -208,7 +223,7 @@ def main():
 
     create_database()
 
-    conn = psycopg2.connect(
+    conn = psycopg.connect(
         host="localhost",
         port=5432,
         user="trader",